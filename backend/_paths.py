@@ -0,0 +1,12 @@
+"""
+Filesystem locations shared across the backend.
+Resolved exactly once at import so other modules never repeat the
+stat/readlink syscalls that Path.resolve() performs.
+"""
+from pathlib import Path
+
+# Repository root (the directory containing .env.local and the frontend)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Environment file read by Settings
+ENV_FILE = str(PROJECT_ROOT / ".env.local")
@@ -2,10 +2,11 @@
 Configuration management for the application.
 Loads environment variables and provides centralized settings.
 """
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
-import os
-from pathlib import Path
+
+from _paths import ENV_FILE
 
 
 class Settings(BaseSettings):
@@ -15,11 +16,28 @@ class Settings(BaseSettings):
     # Use field alias to accept both GEMINI_API_KEY and API_KEY
     gemini_api_key: str
     model_name: str = "gemini-2.5-flash"
+    # Route background triage calls through the Gemini Batch API
+    # (~50% cheaper, minutes-scale latency) instead of the interactive tier
+    use_batch_triage: bool = False
+    # Demote chat follow-ups to the discounted Batch tier as well; user-facing
+    # validation always stays interactive, so its latency is never sacrificed
+    chat_use_batch: bool = False
+    # Group all tasks queued between drains into a single Batch submission
+    # instead of one API call per task; the per-task path stays the default
+    batch_drain_triage: bool = False
+    batch_drain_interval: float = 30.0
+    # Client-side throttling for interactive Gemini calls: concurrency cap
+    # plus requests-per-minute budget, kept just under the project quota so
+    # load is smoothed instead of burned on 429 retries
+    max_concurrent_gemini: int = 8
+    gemini_requests_per_minute: int = 60
     
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
-    reload: bool = True
+    # Auto-reload is opt-in (set RELOAD=true in .env.local for development);
+    # the watchdog subprocess it spawns doubles cold-start cost in containers
+    reload: bool = False
     
     # CORS Configuration
     cors_origins: list[str] = ["http://localhost:5173", "http://localhost:3000", "http://localhost:8080"]
@@ -32,16 +50,23 @@ class Settings(BaseSettings):
     
     class Config:
         # Look for .env.local in parent directory (project root)
-        env_file = str(Path(__file__).parent.parent / ".env.local")
+        env_file = ENV_FILE
         env_file_encoding = "utf-8"
         case_sensitive = False
 
 
-# Global settings instance
-try:
-    settings = Settings()
-except Exception as e:
-    print(f"Error loading settings: {e}")
-    print("Make sure your .env.local file exists in the project root with API_KEY set")
-    raise
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the shared Settings instance, building it on first call.
+
+    Deferring construction keeps the .env.local read and Pydantic schema
+    build off the import path; tests can reset via get_settings.cache_clear().
+    """
+    try:
+        return Settings()
+    except Exception as e:
+        print(f"Error loading settings: {e}")
+        print("Make sure your .env.local file exists in the project root with API_KEY set")
+        raise
 
@@ -2,18 +2,79 @@
 FastAPI application for log triage backend.
 Main entry point for the API server.
 """
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from config import settings
+from config import get_settings
+from models import schemas
 from routes import router
 
 
+# Resolve settings at app-construction time (first get_settings() call
+# reads .env.local and builds the Pydantic schema; later calls are cached)
+settings = get_settings()
+
+# Optional pre-generated OpenAPI document, written at deploy time
+_OPENAPI_CACHE = Path(__file__).resolve().parent / "openapi.json"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Construct the service singletons once, before serving traffic."""
+    # Imported here so module import stays light; the heavy google-genai
+    # SDK loads exactly once, at server startup
+    from services import GeminiAIService, RAGService, Services, TaskManager
+
+    ai_service = GeminiAIService()
+    task_manager = TaskManager(ai_service)
+    app.state.services = Services(
+        ai_service=ai_service,
+        task_manager=task_manager,
+        rag_service=RAGService()
+    )
+
+    # When enabled, queued tasks are swept into one Batch submission per
+    # interval instead of being processed one API call at a time
+    drain_task = None
+    if settings.batch_drain_triage:
+        drain_task = asyncio.create_task(
+            task_manager.run_drain_loop(settings.batch_drain_interval)
+        )
+
+    # Pre-pay Pydantic validator construction and the OpenAPI walk so the
+    # first real request doesn't hit a first-use latency spike
+    for model in schemas.all_models():
+        model.model_rebuild()
+
+    # A schema exported at deploy time (e.g.
+    # python -c "import main, orjson; open('openapi.json','wb').write(orjson.dumps(main.app.openapi()))")
+    # skips the startup schema walk entirely; otherwise build and memoize now
+    if _OPENAPI_CACHE.is_file():
+        app.openapi_schema = orjson.loads(_OPENAPI_CACHE.read_bytes())
+    else:
+        app.openapi()
+
+    yield
+
+    if drain_task is not None:
+        drain_task.cancel()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Log Triage API",
     description="Backend API for AI-powered log analysis and triage",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes responses several times faster than stdlib json,
+    # which matters for the frequently-polled /api/triage/status endpoint
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -21,8 +82,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Concrete lists let the CORS middleware take its set-membership fast
+    # path on preflights instead of expanding wildcards per request
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
 )
 
 # Include API router
@@ -46,5 +109,9 @@ if __name__ == "__main__":
         "main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.reload
+        reload=settings.reload,
+        # C-accelerated event loop and HTTP parser (shipped with
+        # uvicorn[standard]) cut per-request asyncio/parsing overhead
+        loop="uvloop",
+        http="httptools"
     )
@@ -6,7 +6,9 @@ from .schemas import (
     TriageResult,
     TriageStatus,
     TaskResponse,
+    TaskStatus,
     LogFile,
+    LogType,
 )
 
 __all__ = [
@@ -16,5 +18,7 @@ __all__ = [
     "TriageResult",
     "TriageStatus",
     "TaskResponse",
+    "TaskStatus",
     "LogFile",
+    "LogType",
 ]
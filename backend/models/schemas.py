@@ -2,10 +2,26 @@
 Pydantic models for request/response validation.
 These models define the API contract and ensure type safety.
 """
-from pydantic import BaseModel, Field
+from enum import StrEnum
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 
 
+class TaskStatus(StrEnum):
+    """Lifecycle states of a triage task."""
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    SUCCESS = "SUCCESS"
+    FAILED = "FAILED"
+
+
+class LogType(StrEnum):
+    """Role of an uploaded log file in a triage comparison."""
+    BAD1 = "bad1"
+    GOOD = "good"
+    BAD2 = "bad2"
+
+
 class ValidationRequest(BaseModel):
     """Request model for validating user's issue description."""
     user_answers: dict[str, str] = Field(..., description="User's answers to questions")
@@ -13,16 +29,26 @@ class ValidationRequest(BaseModel):
 
 
 class ValidationResult(BaseModel):
-    """Response model for validation results."""
-    is_sufficient: bool = Field(..., description="Whether description is sufficient")
-    clarifying_question: str = Field(default="", description="Question to ask if insufficient")
+    """Response model for validation results.
+
+    The camelCase validation aliases match the JSON keys Gemini is
+    instructed to emit, so model responses parse directly via
+    model_validate_json; serialization stays on the snake_case field
+    names the API contract uses.
+    """
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, str_strip_whitespace=False, populate_by_name=True)
+
+    is_sufficient: bool = Field(..., validation_alias="isSufficient", description="Whether description is sufficient")
+    clarifying_question: str = Field(default="", validation_alias="clarifyingQuestion", description="Question to ask if insufficient")
     summary: str = Field(default="", description="Summary if sufficient")
 
 
 class LogFile(BaseModel):
     """Model for uploaded log file."""
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, str_strip_whitespace=False)
+
     content: str = Field(..., description="Log file content")
-    type: Literal["bad1", "good", "bad2"] = Field(..., description="Type of log file")
+    type: LogType = Field(..., description="Type of log file")
 
 
 class TriageRequest(BaseModel):
@@ -32,17 +58,25 @@ class TriageRequest(BaseModel):
 
 
 class TriageResult(BaseModel):
-    """Model for triage analysis results."""
+    """Model for triage analysis results.
+
+    The camelCase validation aliases match the JSON keys Gemini is
+    instructed to emit, so model responses parse directly via
+    model_validate_json; serialization stays on the snake_case field
+    names the API contract uses.
+    """
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, str_strip_whitespace=False, populate_by_name=True)
+
     summary: str = Field(..., description="Executive summary of the problem")
-    potential_issues: list[str] = Field(..., description="List of identified issues")
-    suggested_actions: list[str] = Field(..., description="List of actionable steps")
+    potential_issues: list[str] = Field(..., validation_alias="potentialIssues", description="List of identified issues")
+    suggested_actions: list[str] = Field(..., validation_alias="suggestedActions", description="List of actionable steps")
 
 
 class TriageStatus(BaseModel):
     """Response model for triage status polling."""
-    status: Literal["PENDING", "PROCESSING", "SUCCESS", "FAILED"] = Field(
-        ..., description="Current task status"
-    )
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, str_strip_whitespace=False)
+
+    status: TaskStatus = Field(..., description="Current task status")
     message: str = Field(..., description="Status message")
     result: Optional[TriageResult] = Field(None, description="Results if completed")
 
@@ -54,6 +88,8 @@ class TaskResponse(BaseModel):
 
 class ChatMessageModel(BaseModel):
     """Model for a single chat message."""
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, str_strip_whitespace=False)
+
     role: Literal["user", "assistant"] = Field(..., description="Role of the message sender")
     content: str = Field(..., description="Content of the message")
 
@@ -93,3 +129,11 @@ class RAGDocumentsResponse(BaseModel):
     """Response model for retrieving RAG documents."""
     documents: list[RAGDocument] = Field(..., description="List of uploaded documents")
     tech_area: str = Field(..., description="Technical area for the documents")
+
+
+def all_models() -> list[type[BaseModel]]:
+    """Return every schema model defined in this module (for startup warm-up)."""
+    return [
+        obj for obj in globals().values()
+        if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel
+    ]
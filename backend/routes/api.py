@@ -2,10 +2,15 @@
 API routes for the log triage application.
 Defines all REST endpoints for validation, triage submission, and status polling.
 """
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+import orjson
+import ormsgpack
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, Depends, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from typing import Annotated
 
 from models.schemas import (
+    LogFile,
     ValidationRequest,
     ValidationResult,
     TriageRequest,
@@ -17,43 +22,22 @@ from models.schemas import (
     RAGUploadResponse,
     RAGDocumentsResponse,
 )
-from services import GeminiAIService, TaskManager, RAGService
+# Only the lightweight service modules are imported at module level; the
+# Gemini implementation (and its google-genai SDK import) is deferred until
+# server startup, keeping cold starts fast.
+from services.container import Services
+from config import get_settings
 
 
 router = APIRouter(prefix="/api")
 
-# Service instances (singleton pattern)
-_ai_service: GeminiAIService | None = None
-_task_manager: TaskManager | None = None
+# The Services container lives on app.state, constructed once in the
+# lifespan handler in main.py; resolving it is a single attribute lookup.
 
 
-def get_ai_service() -> GeminiAIService:
-    """Dependency to get AI service instance."""
-    global _ai_service
-    if _ai_service is None:
-        _ai_service = GeminiAIService()
-    return _ai_service
-
-
-def get_task_manager(
-    ai_service: Annotated[GeminiAIService, Depends(get_ai_service)]
-) -> TaskManager:
-    """Dependency to get task manager instance."""
-    global _task_manager
-    if _task_manager is None:
-        _task_manager = TaskManager(ai_service)
-    return _task_manager
-
-
-_rag_service: RAGService | None = None
-
-
-def get_rag_service() -> RAGService:
-    """Dependency to get RAG service instance."""
-    global _rag_service
-    if _rag_service is None:
-        _rag_service = RAGService()
-    return _rag_service
+def get_services(request: Request) -> Services:
+    """Dependency to get the singleton service container."""
+    return request.app.state.services
 
 
 @router.get("/health")
@@ -65,20 +49,20 @@ async def health_check():
 @router.post("/validate", response_model=ValidationResult)
 async def validate_description(
     request: ValidationRequest,
-    ai_service: Annotated[GeminiAIService, Depends(get_ai_service)]
+    services: Annotated[Services, Depends(get_services)]
 ) -> ValidationResult:
     """
     Validate if the user's issue description is sufficient.
-    
+
     Args:
         request: Validation request with user answers and current description
-        ai_service: AI service dependency
-        
+        services: Service container dependency
+
     Returns:
         ValidationResult with sufficiency status and clarifying question or summary
     """
     try:
-        result = await ai_service.validate_description(
+        result = await services.ai_service.validate_description(
             user_answers=request.user_answers,
             current_description=request.current_description
         )
@@ -91,30 +75,141 @@ async def validate_description(
 async def submit_triage(
     request: TriageRequest,
     background_tasks: BackgroundTasks,
-    task_manager: Annotated[TaskManager, Depends(get_task_manager)]
+    services: Annotated[Services, Depends(get_services)]
 ) -> TaskResponse:
     """
     Submit a triage request and get a task ID.
     The actual processing happens in the background.
-    
+
     Args:
         request: Triage request with logs and user answers
         background_tasks: FastAPI background tasks
-        task_manager: Task manager dependency
-        
+        services: Service container dependency
+
     Returns:
         TaskResponse with task ID for polling
     """
     try:
         # Create task
-        task_id = task_manager.create_task(
+        task_id = await services.task_manager.create_task(
             logs=request.logs,
             user_answers=request.user_answers
         )
-        
-        # Schedule background processing
-        background_tasks.add_task(task_manager.process_task, task_id)
-        
+
+        # Schedule per-task processing unless the periodic batch drain
+        # loop owns pending tasks
+        if not get_settings().batch_drain_triage:
+            background_tasks.add_task(services.task_manager.process_task, task_id)
+
+        return TaskResponse(task_id=task_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to submit triage: {str(e)}")
+
+
+@router.post("/triage/bin", response_model=TaskResponse)
+async def submit_triage_bin(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    services: Annotated[Services, Depends(get_services)]
+) -> TaskResponse:
+    """
+    Submit a triage request encoded as MessagePack and get a task ID.
+
+    Accepts the same structure as /triage but as an application/msgpack
+    body, which internal clients can use to skip JSON string-escape
+    decoding on large log payloads. External clients keep the JSON
+    endpoint.
+
+    Args:
+        request: Raw request carrying the msgpack-encoded TriageRequest
+        background_tasks: FastAPI background tasks
+        services: Service container dependency
+
+    Returns:
+        TaskResponse with task ID for polling
+    """
+    body = await request.body()
+
+    try:
+        payload = ormsgpack.unpackb(body)
+        triage_request = TriageRequest.model_validate(payload)
+    except (ormsgpack.MsgpackDecodeError, ValidationError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid msgpack triage request: {str(e)}")
+
+    try:
+        # Create task
+        task_id = await services.task_manager.create_task(
+            logs=triage_request.logs,
+            user_answers=triage_request.user_answers
+        )
+
+        # Schedule per-task processing unless the periodic batch drain
+        # loop owns pending tasks
+        if not get_settings().batch_drain_triage:
+            background_tasks.add_task(services.task_manager.process_task, task_id)
+
+        return TaskResponse(task_id=task_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to submit triage: {str(e)}")
+
+
+@router.post("/triage/upload", response_model=TaskResponse)
+async def submit_triage_upload(
+    background_tasks: BackgroundTasks,
+    services: Annotated[Services, Depends(get_services)],
+    logs: Annotated[list[UploadFile], File(description="Log files to analyze")],
+    log_types: Annotated[list[str], Form(description="Type of each log file, in order")],
+    user_answers: Annotated[str, Form(description="JSON object of user's answers")]
+) -> TaskResponse:
+    """
+    Submit a triage request as a multipart upload and get a task ID.
+
+    Unlike /triage, log content arrives as raw file parts instead of
+    JSON-escaped strings, so large logs avoid the double buffering and
+    escape-decoding cost of a JSON body. The JSON endpoint remains for
+    existing clients.
+
+    Args:
+        background_tasks: FastAPI background tasks
+        services: Service container dependency
+        logs: Uploaded log files
+        log_types: Log type ("bad1", "good" or "bad2") for each file, in order
+        user_answers: User's answers to questions as a JSON object
+
+    Returns:
+        TaskResponse with task ID for polling
+    """
+    if len(logs) != len(log_types):
+        raise HTTPException(
+            status_code=400,
+            detail="Each uploaded log file needs a matching log_types entry"
+        )
+
+    try:
+        answers = orjson.loads(user_answers)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="user_answers must be a JSON object")
+
+    try:
+        log_files = [
+            LogFile(content=(await upload.read()).decode("utf-8", errors="replace"), type=log_type)
+            for upload, log_type in zip(logs, log_types)
+        ]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid log file: {str(e)}")
+
+    try:
+        # Create task
+        task_id = await services.task_manager.create_task(
+            logs=log_files,
+            user_answers=answers
+        )
+
+        # Schedule per-task processing unless the periodic batch drain
+        # loop owns pending tasks
+        if not get_settings().batch_drain_triage:
+            background_tasks.add_task(services.task_manager.process_task, task_id)
+
         return TaskResponse(task_id=task_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to submit triage: {str(e)}")
@@ -123,20 +218,20 @@ async def submit_triage(
 @router.get("/triage/status/{task_id}", response_model=TriageStatus)
 async def get_triage_status(
     task_id: str,
-    task_manager: Annotated[TaskManager, Depends(get_task_manager)]
+    services: Annotated[Services, Depends(get_services)]
 ) -> TriageStatus:
     """
     Poll the status of a triage task.
-    
+
     Args:
         task_id: The task ID to check
-        task_manager: Task manager dependency
-        
+        services: Service container dependency
+
     Returns:
         TriageStatus with current status and result if complete
     """
-    status, message, result = task_manager.get_task_status(task_id)
-    
+    status, message, result = await services.task_manager.get_task_status(task_id)
+
     return TriageStatus(
         status=status,
         message=message,
@@ -144,23 +239,59 @@ async def get_triage_status(
     )
 
 
+@router.get("/triage/events/{task_id}")
+async def triage_events(
+    task_id: str,
+    services: Annotated[Services, Depends(get_services)]
+) -> StreamingResponse:
+    """
+    Stream status updates for a triage task as Server-Sent Events.
+
+    Each event carries a TriageStatus JSON payload; updates are pushed as
+    soon as the task transitions state, with a periodic heartbeat while
+    waiting. The stream ends once the task reaches a terminal state, so
+    clients using this endpoint avoid polling /triage/status entirely.
+
+    Args:
+        task_id: The task ID to watch
+        services: Service container dependency
+
+    Returns:
+        StreamingResponse emitting text/event-stream data
+    """
+    task_manager = services.task_manager
+
+    async def event_stream():
+        while True:
+            status, message, result = await task_manager.get_task_status(task_id)
+            payload = TriageStatus(status=status, message=message, result=result)
+            yield f"data: {payload.model_dump_json()}\n\n"
+
+            if status in ("SUCCESS", "FAILED"):
+                break
+
+            await task_manager.wait_for_update(task_id)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.post("/triage/cancel/{task_id}")
 async def cancel_triage(
     task_id: str,
-    task_manager: Annotated[TaskManager, Depends(get_task_manager)]
+    services: Annotated[Services, Depends(get_services)]
 ) -> dict:
     """
     Cancel a pending or processing triage task.
-    
+
     Args:
         task_id: The task ID to cancel
-        task_manager: Task manager dependency
-        
+        services: Service container dependency
+
     Returns:
         Success status
     """
-    cancelled = task_manager.cancel_task(task_id)
-    
+    cancelled = await services.task_manager.cancel_task(task_id)
+
     if cancelled:
         return {"success": True, "message": "Task cancelled successfully"}
     else:
@@ -171,80 +302,144 @@ async def cancel_triage(
 async def chat_about_report(
     task_id: str,
     request: ChatRequest,
-    ai_service: Annotated[GeminiAIService, Depends(get_ai_service)],
-    task_manager: Annotated[TaskManager, Depends(get_task_manager)]
+    services: Annotated[Services, Depends(get_services)]
 ) -> ChatResponse:
     """
     Chat about a completed triage report.
-    
+
     Args:
         task_id: The task ID of the completed triage
         request: Chat request with user message and history
-        ai_service: AI service dependency
-        task_manager: Task manager dependency
-        
+        services: Service container dependency
+
     Returns:
         ChatResponse with AI's answer
     """
     # Get the task context
-    task = task_manager.get_task_for_chat(task_id)
-    
+    task = await services.task_manager.get_task_for_chat(task_id)
+
     if not task:
         raise HTTPException(
             status_code=404,
             detail="Task not found or not yet completed. Please complete the triage first."
         )
-    
+
     if not task.result:
         raise HTTPException(
             status_code=400,
             detail="No triage result available for this task."
         )
-    
+
     try:
-        # Convert history to the format expected by the service
-        history = [{"role": msg.role, "content": msg.content} for msg in request.history]
-        
+        # Convert history to the format expected by the service using
+        # pydantic-core's Rust serializer rather than attribute walking
+        history = [msg.model_dump() for msg in request.history]
+
         # Call AI service to generate response
-        response_text = await ai_service.chat_about_report(
+        response_text = await services.ai_service.chat_about_report(
             user_message=request.message,
             triage_result=task.result,
             logs=task.logs,
             user_answers=task.user_answers,
             conversation_history=history
         )
-        
+
         # Store the conversation in task history
-        task_manager.add_chat_message(task_id, "user", request.message)
-        task_manager.add_chat_message(task_id, "assistant", response_text)
-        
+        await services.task_manager.add_chat_message(task_id, "user", request.message)
+        await services.task_manager.add_chat_message(task_id, "assistant", response_text)
+
         return ChatResponse(response=response_text)
-    
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
 
 
+@router.post("/chat/{task_id}/stream")
+async def chat_about_report_stream(
+    task_id: str,
+    request: ChatRequest,
+    services: Annotated[Services, Depends(get_services)]
+) -> StreamingResponse:
+    """
+    Chat about a completed triage report, streaming the response as SSE.
+
+    Emits the answer incrementally as it is generated, so clients can
+    render text as soon as the first tokens arrive instead of waiting for
+    the full response. Each event is a JSON object with a "text" chunk;
+    the final event is {"done": true}. The non-streaming /chat endpoint
+    remains for existing clients.
+
+    Args:
+        task_id: The task ID of the completed triage
+        request: Chat request with user message and history
+        services: Service container dependency
+
+    Returns:
+        StreamingResponse emitting text/event-stream data
+    """
+    # Get the task context
+    task = await services.task_manager.get_task_for_chat(task_id)
+
+    if not task:
+        raise HTTPException(
+            status_code=404,
+            detail="Task not found or not yet completed. Please complete the triage first."
+        )
+
+    if not task.result:
+        raise HTTPException(
+            status_code=400,
+            detail="No triage result available for this task."
+        )
+
+    history = [msg.model_dump() for msg in request.history]
+
+    async def event_stream():
+        chunks = []
+        try:
+            async for chunk in services.ai_service.chat_about_report_stream(
+                user_message=request.message,
+                triage_result=task.result,
+                logs=task.logs,
+                user_answers=task.user_answers,
+                conversation_history=history
+            ):
+                chunks.append(chunk)
+                yield f"data: {orjson.dumps({'text': chunk}).decode()}\n\n"
+        except Exception as e:
+            # Headers are already sent, so surface errors in-band
+            yield f"data: {orjson.dumps({'error': f'Chat failed: {str(e)}'}).decode()}\n\n"
+            return
+
+        # Store the conversation in task history once the answer is complete
+        await services.task_manager.add_chat_message(task_id, "user", request.message)
+        await services.task_manager.add_chat_message(task_id, "assistant", "".join(chunks))
+        yield f"data: {orjson.dumps({'done': True}).decode()}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.post("/rag/upload", response_model=RAGUploadResponse)
 async def upload_rag_documents(
     request: RAGUploadRequest,
-    rag_service: Annotated[RAGService, Depends(get_rag_service)]
+    services: Annotated[Services, Depends(get_services)]
 ) -> RAGUploadResponse:
     """
     Upload documents to the RAG system.
-    
+
     Args:
         request: Upload request with documents and tech area
-        rag_service: RAG service dependency
-        
+        services: Service container dependency
+
     Returns:
         RAGUploadResponse with success status
     """
     try:
-        count = await rag_service.ingest_documents(
+        count = await services.rag_service.ingest_documents(
             documents=request.documents,
             tech_area=request.tech_area
         )
-        
+
         return RAGUploadResponse(
             success=True,
             processed_count=count,
@@ -257,21 +452,21 @@ async def upload_rag_documents(
 @router.get("/rag/documents/{tech_area}", response_model=RAGDocumentsResponse)
 async def get_rag_documents(
     tech_area: str,
-    rag_service: Annotated[RAGService, Depends(get_rag_service)]
+    services: Annotated[Services, Depends(get_services)]
 ) -> RAGDocumentsResponse:
     """
     Retrieve uploaded documents for a specific technical area.
-    
+
     Args:
         tech_area: The technical area to retrieve documents for
-        rag_service: RAG service dependency
-        
+        services: Service container dependency
+
     Returns:
         RAGDocumentsResponse with list of documents
     """
     try:
-        documents = await rag_service.get_documents(tech_area)
-        
+        documents = await services.rag_service.get_documents(tech_area)
+
         return RAGDocumentsResponse(
             documents=documents,
             tech_area=tech_area
@@ -1,7 +1,35 @@
-"""Services package."""
-from .base import BaseAIService
-from .gemini_service import GeminiAIService
-from .task_manager import TaskManager
-from .rag_service import RAGService
+"""Services package.
 
-__all__ = ["GeminiAIService", "TaskManager", "RAGService"]
+Service classes are imported lazily (PEP 562) so that importing this package
+does not pull in heavy third-party dependencies (e.g. the google-genai SDK)
+until a service is actually needed.
+"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .container import Services
+    from .gemini_service import GeminiAIService
+    from .rag_service import RAGService
+    from .task_manager import TaskManager
+
+__all__ = ["GeminiAIService", "TaskManager", "RAGService", "Services"]
+
+# Maps lazily-imported names to the submodules that define them
+_LAZY_IMPORTS = {
+    "GeminiAIService": "gemini_service",
+    "TaskManager": "task_manager",
+    "RAGService": "rag_service",
+    "Services": "container",
+}
+
+
+def __getattr__(name: str):
+    """Lazily import service classes on first attribute access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        module = import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        attr = getattr(module, name)
+        globals()[name] = attr  # Cache so __getattr__ only fires once per name
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
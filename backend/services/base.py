@@ -4,6 +4,7 @@ This defines the interface that all AI service implementations must follow,
 enabling easy swapping between different AI providers (Gemini, OpenAI, etc.).
 """
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 from models.schemas import ValidationResult, TriageResult, LogFile
 
 
@@ -50,3 +51,70 @@ class BaseAIService(ABC):
             TriageResult with analysis summary, issues, and suggested actions
         """
         pass
+
+    @abstractmethod
+    async def perform_triage_batch(
+        self,
+        jobs: list[tuple[list[LogFile], dict[str, str]]],
+        poll_interval: float = 30.0
+    ) -> list["TriageResult | Exception"]:
+        """
+        Perform log triage for several tasks in one provider-side batch.
+
+        Args:
+            jobs: (logs, user_answers) pairs, one per task
+            poll_interval: Seconds between provider job-state polls
+
+        Returns:
+            Per-job results in input order; individual failures are
+            returned as Exception instances
+        """
+        pass
+
+    @abstractmethod
+    async def chat_about_report(
+        self,
+        user_message: str,
+        triage_result: TriageResult,
+        logs: list[LogFile],
+        user_answers: dict[str, str],
+        conversation_history: list[dict[str, str]]
+    ) -> str:
+        """
+        Chat about a completed triage report.
+
+        Args:
+            user_message: The user's question
+            triage_result: The original triage analysis result
+            logs: The original log files
+            user_answers: The user's original answers
+            conversation_history: Previous chat messages
+
+        Returns:
+            AI's response to the user's question
+        """
+        pass
+
+    @abstractmethod
+    def chat_about_report_stream(
+        self,
+        user_message: str,
+        triage_result: TriageResult,
+        logs: list[LogFile],
+        user_answers: dict[str, str],
+        conversation_history: list[dict[str, str]]
+    ) -> AsyncIterator[str]:
+        """
+        Chat about a completed triage report, streaming the response.
+
+        Args:
+            user_message: The user's question
+            triage_result: The original triage analysis result
+            logs: The original log files
+            user_answers: The user's original answers
+            conversation_history: Previous chat messages
+
+        Yields:
+            Incremental text chunks of the AI's response
+        """
+        pass
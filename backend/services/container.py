@@ -0,0 +1,20 @@
+"""
+Service container bundling the application's singleton services.
+Built once in the lifespan handler and resolved through a single
+FastAPI dependency, so each request does one attribute lookup instead
+of resolving three separate dependencies.
+"""
+from dataclasses import dataclass
+
+from .base import BaseAIService
+from .rag_service import RAGService
+from .task_manager import TaskManager
+
+
+@dataclass(frozen=True)
+class Services:
+    """Bundle of the singleton services used by the API routes."""
+
+    ai_service: BaseAIService
+    task_manager: TaskManager
+    rag_service: RAGService
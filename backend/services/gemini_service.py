@@ -2,23 +2,311 @@
 Gemini AI service implementation.
 This is the concrete implementation of BaseAIService using Google's Gemini API.
 """
-import json
+import asyncio
+import hashlib
+from functools import lru_cache
+from typing import AsyncIterator
+
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 from google import genai
-from google.genai.types import GenerateContentConfig, Schema, Type
+from google.genai.types import GenerateContentConfig, InlinedRequest, JobState, Schema, Type
 
 from .base import BaseAIService
-from models.schemas import ValidationResult, TriageResult, LogFile
-from config import settings
+from models.schemas import ValidationResult, TriageResult, LogFile, LogType
+from config import get_settings
+
+
+# Bump whenever prompt wording changes so stale cached responses are dropped
+PROMPT_VERSION = "v2"
+
+# Completed responses keyed by prompt hash; identical resubmissions (retries,
+# duplicate log uploads) skip the API round-trip and its token cost entirely
+_response_cache: TTLCache = TTLCache(maxsize=1024, ttl=7 * 86400)
+
+
+# Static instruction blocks are module constants placed at the *start* of
+# every prompt, with per-request content appended after them; a byte-stable
+# prefix lets Gemini's implicit context caching reuse those tokens across
+# requests. The prefixes are well below the API's minimum size for explicit
+# CachedContent, so no cache handle is created for them.
+_VALIDATION_PROMPT_PREFIX = """
+You are a helpful Senior Site Reliability Engineer (SRE) helping a user describe their technical issue.
+The user has provided some initial context and a description of their problem.
+Your task is to determine if their description is sufficient for a technical investigation, and if so, summarize it for confirmation.
+A good description includes three key elements:
+1.  **Action:** What the user was trying to do.
+2.  **Observation:** What actually happened (e.g., error message, unexpected behavior).
+3.  **Expectation:** What the user expected to happen.
+
+Analyze the "User's Problem Description" provided below.
+- If it clearly contains all three elements (Action, Observation, Expectation), then the description is sufficient. In this case, you MUST create a concise summary of your understanding for the user to confirm.
+- If one or more elements are missing or unclear, ask a single, simple, and direct question to get the missing information. For example, if the expectation is missing, ask "What did you expect to happen?".
+
+Please respond in a structured JSON format.
+The JSON object must contain three keys:
+1.  "isSufficient": A boolean, true if the description is sufficient, false otherwise.
+2.  "clarifyingQuestion": A string. If the description is NOT sufficient, this should contain the question to ask the user. If it IS sufficient, this should be an empty string.
+3.  "summary": A string. If the description IS sufficient, this should contain your summary. Phrase it as a confirmation, for example: "Okay, let me confirm my understanding. You were trying to update a user's profile, but you observed a '500 Internal Server Error', and you expected to see a success message. Is this correct?". If the description is NOT sufficient, this should be an empty string.
+"""
+
+_TRIAGE_PROMPT_PREFIX = """
+You are an expert Senior Site Reliability Engineer (SRE) performing a log triage.
+A user has provided a description of their issue, some context, and one or two log files.
+Your task is to analyze the log file(s), identify the root cause, and suggest actionable steps.
+
+Please provide your analysis in a structured JSON format.
+The JSON object should contain three keys:
+1. "summary": A brief, one-paragraph executive summary of the problem. If a comparison was done, this summary MUST explain the key differences found.
+2. "potentialIssues": An array of strings, where each string is a specific error or issue you identified.
+3. "suggestedActions": An array of strings, where each string is a clear, actionable step for a developer to take. Prioritize the most likely solutions first. Each action should be a concise instruction.
+"""
+
+_LOG_SUMMARY_PROMPT_PREFIX = """
+You are an expert Senior Site Reliability Engineer (SRE) summarizing a single log file as one input to a wider triage.
+Write a concise paragraph describing what the log shows, then list every error, warning, stack trace, timeout, or anomalous timing you find, quoting the relevant lines verbatim. Finish by noting the state the log ends in.
+"""
+
+_CHAT_PROMPT_PREFIX = """
+You are an expert Senior Site Reliability Engineer (SRE) helping a user understand a log triage report.
+The user has already received a triage analysis and now has follow-up questions.
+
+Please provide a helpful, detailed response to the user's question. You can reference:
+- Specific parts of the logs (quote relevant lines)
+- The issues identified in the triage report
+- The suggested actions
+- Technical details about the errors or problems
+
+Be conversational but technically accurate. If the user asks about something not in the logs or report, acknowledge the limitation but provide useful context where possible.
+"""
+
+
+# Response schemas and generation configs are immutable per method, so they
+# are built once here instead of being reallocated on every call
+_VALIDATION_RESPONSE_SCHEMA = Schema(
+    type=Type.OBJECT,
+    properties={
+        "isSufficient": Schema(type=Type.BOOLEAN),
+        "clarifyingQuestion": Schema(type=Type.STRING),
+        "summary": Schema(type=Type.STRING)
+    },
+    required=["isSufficient", "clarifyingQuestion", "summary"]
+)
+
+_TRIAGE_RESPONSE_SCHEMA = Schema(
+    type=Type.OBJECT,
+    properties={
+        "summary": Schema(type=Type.STRING),
+        "potentialIssues": Schema(
+            type=Type.ARRAY,
+            items=Schema(type=Type.STRING)
+        ),
+        "suggestedActions": Schema(
+            type=Type.ARRAY,
+            items=Schema(type=Type.STRING)
+        )
+    },
+    required=["summary", "potentialIssues", "suggestedActions"]
+)
+
+_VALIDATION_CONFIG = GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_VALIDATION_RESPONSE_SCHEMA
+)
+
+_TRIAGE_CONFIG = GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_TRIAGE_RESPONSE_SCHEMA
+)
+
+_SUMMARY_CONFIG = GenerateContentConfig()
+
+_CHAT_CONFIG = GenerateContentConfig(
+    temperature=0.7  # Slightly more creative for conversational responses
+)
+
+# Batch job states that will never make further progress
+_BATCH_TERMINAL_STATES = frozenset({
+    JobState.JOB_STATE_SUCCEEDED,
+    JobState.JOB_STATE_FAILED,
+    JobState.JOB_STATE_CANCELLED,
+    JobState.JOB_STATE_EXPIRED,
+})
+
+
+# Log-compaction parameters: logs below the cap go to the model verbatim;
+# larger ones are reduced to head/tail context plus matched error lines
+_COMPACT_LOG_MAX_CHARS = 32_000
+_COMPACT_HEAD_LINES = 50
+_COMPACT_TAIL_LINES = 200
+_COMPACT_GREP_PATTERNS = ("ERROR", "EXCEPTION", "Exception", "Traceback", "WARN", "FATAL")
+
+
+def _compact_log(
+    content: str,
+    head: int = _COMPACT_HEAD_LINES,
+    tail: int = _COMPACT_TAIL_LINES,
+    grep_patterns: tuple[str, ...] = _COMPACT_GREP_PATTERNS
+) -> str:
+    """
+    Trim a large log to its head, its tail, and error-relevant middle lines.
+
+    Most of a log's triage value sits in error/warning lines and in how the
+    log ends; prompt cost scales linearly with input tokens, so shipping
+    multi-MB logs verbatim is mostly waste. Logs at or below
+    _COMPACT_LOG_MAX_CHARS are returned unchanged.
+
+    Args:
+        content: Raw log text
+        head: Number of leading lines to keep
+        tail: Number of trailing lines to keep
+        grep_patterns: Substrings marking middle lines worth keeping
+
+    Returns:
+        The original or compacted log text
+    """
+    if len(content) <= _COMPACT_LOG_MAX_CHARS:
+        return content
+
+    lines = content.splitlines()
+    if len(lines) <= head + tail:
+        middle = []
+        head_lines = lines
+        tail_lines = []
+    else:
+        head_lines = lines[:head]
+        tail_lines = lines[-tail:]
+        middle = lines[head:-tail]
+
+    matched = [
+        line for line in middle
+        if any(pattern in line for pattern in grep_patterns)
+    ]
+    omitted = len(middle) - len(matched)
+
+    parts = head_lines
+    if middle:
+        parts = parts + [
+            f"... [truncated {omitted} lines; error/warning lines kept below] ..."
+        ] + matched
+    compacted = "\n".join(parts + tail_lines)
+
+    # Pathological logs can blow the cap with matched lines alone
+    if len(compacted) > _COMPACT_LOG_MAX_CHARS:
+        compacted = compacted[:_COMPACT_LOG_MAX_CHARS] + "\n... [truncated] ..."
+    return compacted
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> genai.Client:
+    """
+    Return the shared Gemini client, constructing it on first use.
+
+    Every genai.Client owns its own HTTPS connection pool; sharing one
+    instance process-wide keeps connections warm across service instances
+    instead of paying a TLS handshake per fresh pool.
+    """
+    return genai.Client(api_key=get_settings().api_key)
+
+
+def _cache_key(model_name: str, prompt: str) -> str:
+    """Content-addressed cache key for a generate call."""
+    return hashlib.sha256(
+        f"{PROMPT_VERSION}:{model_name}:{prompt}".encode()
+    ).hexdigest()
 
 
 class GeminiAIService(BaseAIService):
     """Gemini AI service implementation."""
-    
+
     def __init__(self):
         """Initialize the Gemini AI client."""
-        self.client = genai.Client(api_key=settings.api_key)
+        settings = get_settings()
+        self.client = _get_client()
         self.model_name = settings.model_name
-    
+        self._summary_semaphore = asyncio.Semaphore(5)
+        # Client-side throttle for interactive generate calls: a semaphore
+        # caps in-flight requests while a token bucket spreads them over the
+        # minute, so bursts queue here instead of bouncing off quota as 429
+        # retries that wreck tail latency. Batch jobs draw on separate quota
+        # and are already minutes-scale, so they bypass the throttle.
+        self._gemini_semaphore = asyncio.Semaphore(settings.max_concurrent_gemini)
+        self._gemini_limiter = AsyncLimiter(
+            max_rate=settings.gemini_requests_per_minute, time_period=60
+        )
+        # In-flight calls keyed by cache key; concurrent identical prompts
+        # share one API call (single-flight) instead of duplicating spend
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def _single_flight(self, key: str, call) -> str:
+        """
+        Run an API call, letting concurrent callers with the same key share it.
+
+        The first caller for a key becomes the leader and runs the call;
+        callers arriving while it is in flight await the leader's result.
+        Completed results land in the response cache (inside the call), so
+        this only needs to cover the in-flight window.
+
+        Args:
+            key: Cache key identifying the call
+            call: Zero-argument coroutine function performing the API call
+
+        Returns:
+            The response text
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Shield so a cancelled follower doesn't cancel the shared future
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            text = await call()
+            if not future.done():
+                future.set_result(text)
+            return text
+        except BaseException as e:
+            if not future.done():
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                    # Waiters still receive it; this just marks the
+                    # exception retrieved when there are none
+                    future.exception()
+                else:
+                    future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _generate_text(self, prompt: str, config: GenerateContentConfig) -> str:
+        """
+        Generate content for a prompt, serving repeats from the response cache.
+
+        Args:
+            prompt: Fully-rendered prompt text
+            config: Generation config for the call
+
+        Returns:
+            The response text
+        """
+        key = _cache_key(self.model_name, prompt)
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        async def call() -> str:
+            async with self._gemini_semaphore, self._gemini_limiter:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=config
+                )
+            _response_cache[key] = response.text
+            return response.text
+
+        return await self._single_flight(key, call)
+
     async def validate_description(
         self,
         user_answers: dict[str, str],
@@ -40,61 +328,22 @@ class GeminiAIService(BaseAIService):
             for key, value in user_answers.items()
         )
         
-        prompt = f"""
-You are a helpful Senior Site Reliability Engineer (SRE) helping a user describe their technical issue.
-The user has provided some initial context and a description of their problem.
-Your task is to determine if their description is sufficient for a technical investigation, and if so, summarize it for confirmation.
-A good description includes three key elements:
-1.  **Action:** What the user was trying to do.
-2.  **Observation:** What actually happened (e.g., error message, unexpected behavior).
-3.  **Expectation:** What the user expected to happen.
-
+        # Static instructions first, per-request content last (implicit
+        # prefix caching)
+        prompt = _VALIDATION_PROMPT_PREFIX + f"""
 ## User Context
 {context}
 
 ## User's Problem Description
 "{current_description}"
-
-Analyze the "User's Problem Description".
-- If it clearly contains all three elements (Action, Observation, Expectation), then the description is sufficient. In this case, you MUST create a concise summary of your understanding for the user to confirm.
-- If one or more elements are missing or unclear, ask a single, simple, and direct question to get the missing information. For example, if the expectation is missing, ask "What did you expect to happen?".
-
-Please respond in a structured JSON format.
-The JSON object must contain three keys:
-1.  "isSufficient": A boolean, true if the description is sufficient, false otherwise.
-2.  "clarifyingQuestion": A string. If the description is NOT sufficient, this should contain the question to ask the user. If it IS sufficient, this should be an empty string.
-3.  "summary": A string. If the description IS sufficient, this should contain your summary. Phrase it as a confirmation, for example: "Okay, let me confirm my understanding. You were trying to update a user's profile, but you observed a '500 Internal Server Error', and you expected to see a success message. Is this correct?". If the description is NOT sufficient, this should be an empty string.
 """
         
-        # Define response schema
-        response_schema = Schema(
-            type=Type.OBJECT,
-            properties={
-                "isSufficient": Schema(type=Type.BOOLEAN),
-                "clarifyingQuestion": Schema(type=Type.STRING),
-                "summary": Schema(type=Type.STRING)
-            },
-            required=["isSufficient", "clarifyingQuestion", "summary"]
-        )
-        
-        # Generate content with structured output
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config=GenerateContentConfig(
-                response_mime_type="application/json",
-                response_schema=response_schema
-            )
-        )
-        
-        # Parse JSON response
-        result_data = json.loads(response.text)
+        # Generate content with structured output, via the response cache
+        response_text = await self._generate_text(prompt, _VALIDATION_CONFIG)
         
-        return ValidationResult(
-            is_sufficient=result_data["isSufficient"],
-            clarifying_question=result_data["clarifyingQuestion"],
-            summary=result_data["summary"]
-        )
+        # Parse the JSON response directly into the model; pydantic-core's
+        # jiter parser skips the intermediate dict and manual field copying
+        return ValidationResult.model_validate_json(response_text)
     
     async def perform_triage(
         self,
@@ -111,6 +360,65 @@ The JSON object must contain three keys:
         Returns:
             TriageResult with analysis summary, issues, and suggested actions
         """
+        if len(logs) > 1:
+            # Summarize each log concurrently, then synthesize from the short
+            # summaries: wall-clock ~ max(per-log latency) + one synthesis
+            # call, and the comparison prompt shrinks to summary size
+            summaries = await asyncio.gather(
+                *(self._summarize_log(log) for log in logs)
+            )
+            condensed = [
+                LogFile(content=summary, type=log.type)
+                for log, summary in zip(logs, summaries)
+            ]
+            prompt = self._build_triage_prompt(condensed, user_answers)
+        else:
+            prompt = self._build_triage_prompt(logs, user_answers)
+
+        # Background triage tolerates minutes-scale latency (the frontend is
+        # already polling), so it can opt in to the discounted Batch tier
+        if get_settings().use_batch_triage:
+            response_text = await self._generate_text_batch(prompt, _TRIAGE_CONFIG)
+        else:
+            response_text = await self._generate_text(prompt, _TRIAGE_CONFIG)
+
+        return self._parse_triage_response(response_text)
+
+    async def _summarize_log(self, log: LogFile) -> str:
+        """
+        Summarize a single log file as input to the comparison step.
+
+        Args:
+            log: The log file to summarize
+
+        Returns:
+            A compact textual summary of the log
+        """
+        prompt = _LOG_SUMMARY_PROMPT_PREFIX + f"""
+## Log File ({log.type} log)
+```
+{_compact_log(log.content)}
+```
+"""
+        # Cap concurrent summaries to stay under Gemini rate limits
+        async with self._summary_semaphore:
+            return await self._generate_text(prompt, _SUMMARY_CONFIG)
+
+    def _build_triage_prompt(
+        self,
+        logs: list[LogFile],
+        user_answers: dict[str, str]
+    ) -> str:
+        """
+        Render the full triage prompt for the given logs and answers.
+
+        Args:
+            logs: List of log files to analyze
+            user_answers: Dictionary of user's answers to questions
+
+        Returns:
+            The complete prompt text
+        """
         # Extract description and other context
         description = user_answers.get("usecase_description", "Not provided.")
         other_context = "\n".join(
@@ -118,41 +426,41 @@ The JSON object must contain three keys:
             for key, value in user_answers.items()
             if key != "usecase_description"
         )
-        
+
         # Build log section based on number of logs
         if len(logs) == 1:
             log_section = f"""
 ## Log File Content
 ```
-{logs[0].content}
+{_compact_log(logs[0].content)}
 ```
 """
         else:
-            bad_log1 = next((log for log in logs if log.type == "bad1"), None)
-            good_log = next((log for log in logs if log.type == "good"), None)
-            bad_log2 = next((log for log in logs if log.type == "bad2"), None)
-            
+            # One pass over the logs instead of a next() scan per type
+            by_type = {log.type: log for log in logs}
+            bad_log1 = by_type.get(LogType.BAD1)
+            good_log = by_type.get(LogType.GOOD)
+            bad_log2 = by_type.get(LogType.BAD2)
+
             log_section = "## Log Files for Comparison\n\n"
-            
+
             if bad_log1:
-                log_section += f"### Log File A (Bad Log)\n```\n{bad_log1.content}\n```\n"
+                log_section += f"### Log File A (Bad Log)\n```\n{_compact_log(bad_log1.content)}\n```\n"
             if good_log:
-                log_section += f"### Log File B (Good Log - for comparison)\n```\n{good_log.content}\n```\n"
+                log_section += f"### Log File B (Good Log - for comparison)\n```\n{_compact_log(good_log.content)}\n```\n"
             if bad_log2:
-                log_section += f"### Log File B (Second Bad Log - for comparison)\n```\n{bad_log2.content}\n```\n"
-        
+                log_section += f"### Log File B (Second Bad Log - for comparison)\n```\n{_compact_log(bad_log2.content)}\n```\n"
+
         comparison_note = ""
         if len(logs) > 1:
             comparison_note = """
 **IMPORTANT**: Two log files have been provided for comparison. Your primary goal is to identify the key differences between them that explain the issue. Focus on new errors, missing success messages, different timings, or changes in behavior between the 'good' and 'bad' logs (or between the two 'bad' logs). Your summary should highlight the findings from this comparison.
 """
-        
-        prompt = f"""
-You are an expert Senior Site Reliability Engineer (SRE) performing a log triage.
-A user has provided a description of their issue, some context, and one or two log files.
-Your task is to analyze the log file(s), identify the root cause, and suggest actionable steps.
-{comparison_note}
 
+        # Static instructions first, per-request content (logs last, as the
+        # largest variable block) appended after
+        return _TRIAGE_PROMPT_PREFIX + f"""
+{comparison_note}
 ## User's Description of the Issue
 {description}
 
@@ -160,49 +468,128 @@ Your task is to analyze the log file(s), identify the root cause, and suggest ac
 {other_context}
 
 {log_section}
-
-Please provide your analysis in a structured JSON format.
-The JSON object should contain three keys:
-1. "summary": A brief, one-paragraph executive summary of the problem. If a comparison was done, this summary MUST explain the key differences found.
-2. "potentialIssues": An array of strings, where each string is a specific error or issue you identified.
-3. "suggestedActions": An array of strings, where each string is a clear, actionable step for a developer to take. Prioritize the most likely solutions first. Each action should be a concise instruction.
 """
-        
-        # Define response schema
-        response_schema = Schema(
-            type=Type.OBJECT,
-            properties={
-                "summary": Schema(type=Type.STRING),
-                "potentialIssues": Schema(
-                    type=Type.ARRAY,
-                    items=Schema(type=Type.STRING)
-                ),
-                "suggestedActions": Schema(
-                    type=Type.ARRAY,
-                    items=Schema(type=Type.STRING)
-                )
-            },
-            required=["summary", "potentialIssues", "suggestedActions"]
-        )
-        
-        # Generate content with structured output
-        response = self.client.models.generate_content(
+
+    async def perform_triage_batch(
+        self,
+        jobs: list[tuple[list[LogFile], dict[str, str]]],
+        poll_interval: float = 30.0
+    ) -> list[TriageResult | Exception]:
+        """
+        Triage several tasks through a single Gemini Batch submission.
+
+        One batch job carries one inlined request per task, so N queued
+        tasks cost one submission plus one polling loop instead of N
+        interactive calls, at the Batch tier's ~50% discount. Prompts are
+        built directly from the (compacted) logs; the per-log summarization
+        pass is an interactive-path optimization and is skipped here.
+
+        Args:
+            jobs: (logs, user_answers) pairs, one per task
+            poll_interval: Seconds between job-state polls
+
+        Returns:
+            Per-job results in input order; individual failures come back
+            as Exception instances rather than failing the whole batch
+
+        Raises:
+            RuntimeError: If the batch job as a whole ends in a
+                non-success state
+        """
+        prompts = [
+            self._build_triage_prompt(logs, user_answers)
+            for logs, user_answers in jobs
+        ]
+
+        job = await self.client.aio.batches.create(
             model=self.model_name,
-            contents=prompt,
-            config=GenerateContentConfig(
-                response_mime_type="application/json",
-                response_schema=response_schema
-            )
-        )
-        
-        # Parse JSON response
-        result_data = json.loads(response.text)
-        
-        return TriageResult(
-            summary=result_data["summary"],
-            potential_issues=result_data["potentialIssues"],
-            suggested_actions=result_data["suggestedActions"]
+            src=[
+                InlinedRequest(contents=prompt, config=_TRIAGE_CONFIG)
+                for prompt in prompts
+            ]
         )
+
+        while job.state not in _BATCH_TERMINAL_STATES:
+            await asyncio.sleep(poll_interval)
+            job = await self.client.aio.batches.get(name=job.name)
+
+        if job.state != JobState.JOB_STATE_SUCCEEDED:
+            raise RuntimeError(f"Batch triage job {job.name} ended in state {job.state}")
+
+        results: list[TriageResult | Exception] = []
+        for inlined in job.dest.inlined_responses:
+            if inlined.error:
+                results.append(RuntimeError(f"Batch triage request failed: {inlined.error}"))
+            else:
+                try:
+                    results.append(self._parse_triage_response(inlined.response.text))
+                except Exception as e:
+                    results.append(e)
+        return results
+
+    def _parse_triage_response(self, response_text: str) -> TriageResult:
+        """
+        Parse the model's JSON triage response.
+
+        Args:
+            response_text: JSON text returned by the model
+
+        Returns:
+            TriageResult with analysis summary, issues, and suggested actions
+        """
+        return TriageResult.model_validate_json(response_text)
+
+    async def _generate_text_batch(
+        self,
+        prompt: str,
+        config: GenerateContentConfig,
+        poll_interval: float = 30.0
+    ) -> str:
+        """
+        Generate content through the Gemini Batch API.
+
+        Batch jobs run at a ~50% discount with minutes-scale turnaround,
+        which the background triage flow already tolerates. Results go
+        through the same response cache as the interactive path.
+
+        Args:
+            prompt: Fully-rendered prompt text
+            config: Generation config for the call
+            poll_interval: Seconds between job-state polls
+
+        Returns:
+            The response text
+
+        Raises:
+            RuntimeError: If the batch job ends in a non-success state
+        """
+        key = _cache_key(self.model_name, prompt)
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        async def call() -> str:
+            job = await self.client.aio.batches.create(
+                model=self.model_name,
+                src=[InlinedRequest(contents=prompt, config=config)]
+            )
+
+            while job.state not in _BATCH_TERMINAL_STATES:
+                await asyncio.sleep(poll_interval)
+                job = await self.client.aio.batches.get(name=job.name)
+
+            if job.state != JobState.JOB_STATE_SUCCEEDED:
+                raise RuntimeError(f"Batch triage job {job.name} ended in state {job.state}")
+
+            inlined = job.dest.inlined_responses[0]
+            if inlined.error:
+                raise RuntimeError(f"Batch triage job {job.name} failed: {inlined.error}")
+
+            response_text = inlined.response.text
+            _response_cache[key] = response_text
+            return response_text
+
+        return await self._single_flight(key, call)
     
     async def chat_about_report(
         self,
@@ -225,6 +612,93 @@ The JSON object should contain three keys:
         Returns:
             AI's response to the user's question
         """
+        prompt = self._build_chat_prompt(
+            user_message, triage_result, logs, user_answers, conversation_history
+        )
+
+        # Generate response via the cache; the prompt embeds the conversation
+        # history, so each distinct chat turn gets its own cache entry
+        # The pinned google-genai SDK exposes no service_tier parameter, so
+        # tiering here means interactive vs Batch: chat follow-ups can be
+        # demoted to the discounted Batch path, while validate_description
+        # (which blocks the user during onboarding) always runs interactively
+        if get_settings().chat_use_batch:
+            return await self._generate_text_batch(prompt, _CHAT_CONFIG, poll_interval=10.0)
+        return await self._generate_text(prompt, _CHAT_CONFIG)
+
+    async def chat_about_report_stream(
+        self,
+        user_message: str,
+        triage_result: TriageResult,
+        logs: list[LogFile],
+        user_answers: dict[str, str],
+        conversation_history: list[dict[str, str]]
+    ) -> AsyncIterator[str]:
+        """
+        Chat about the triage report, yielding the response as it is generated.
+
+        Streaming cuts time-to-first-token from full-response latency to a
+        second or two, which matters for multi-paragraph chat answers. Cache
+        hits are replayed as a single chunk; completed streams are cached for
+        the non-streaming path too.
+
+        Args:
+            user_message: The user's question
+            triage_result: The original triage analysis result
+            logs: The original log files
+            user_answers: The user's original answers
+            conversation_history: Previous chat messages
+
+        Yields:
+            Incremental text chunks of the AI's response
+        """
+        prompt = self._build_chat_prompt(
+            user_message, triage_result, logs, user_answers, conversation_history
+        )
+
+        key = _cache_key(self.model_name, prompt)
+        cached = _response_cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        # Hold the semaphore for the stream's lifetime (it occupies a model
+        # slot until the last chunk), but only charge the limiter once
+        async with self._gemini_semaphore:
+            async with self._gemini_limiter:
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=_CHAT_CONFIG
+                )
+            chunks = []
+            async for chunk in stream:
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+        _response_cache[key] = "".join(chunks)
+
+    def _build_chat_prompt(
+        self,
+        user_message: str,
+        triage_result: TriageResult,
+        logs: list[LogFile],
+        user_answers: dict[str, str],
+        conversation_history: list[dict[str, str]]
+    ) -> str:
+        """
+        Render the full chat prompt for a follow-up question.
+
+        Args:
+            user_message: The user's question
+            triage_result: The original triage analysis result
+            logs: The original log files
+            user_answers: The user's original answers
+            conversation_history: Previous chat messages
+
+        Returns:
+            The complete prompt text
+        """
         # Build log section
         if len(logs) == 1:
             log_section = f"""
@@ -249,11 +723,19 @@ The JSON object should contain three keys:
         
         # Build the complete context prompt
         description = user_answers.get("usecase_description", "Not provided.")
-        
-        prompt = f"""
-You are an expert Senior Site Reliability Engineer (SRE) helping a user understand a log triage report.
-The user has already received a triage analysis and now has follow-up questions.
 
+        # Numbered lists are joined once up front with a plain "\n" rather
+        # than chr(10) calls embedded in the f-string
+        issues_block = "\n".join(
+            f"{i}. {issue}" for i, issue in enumerate(triage_result.potential_issues, 1)
+        )
+        actions_block = "\n".join(
+            f"{i}. {action}" for i, action in enumerate(triage_result.suggested_actions, 1)
+        )
+
+        # Static instructions first; the user's question goes last so every
+        # earlier block stays byte-stable across turns
+        return _CHAT_PROMPT_PREFIX + f"""
 ## Original Issue Description
 {description}
 
@@ -261,33 +743,14 @@ The user has already received a triage analysis and now has follow-up questions.
 {triage_result.summary}
 
 ## Identified Issues
-{chr(10).join(f"{i+1}. {issue}" for i, issue in enumerate(triage_result.potential_issues))}
+{issues_block}
 
 ## Suggested Actions
-{chr(10).join(f"{i+1}. {action}" for i, action in enumerate(triage_result.suggested_actions))}
+{actions_block}
 
 {log_section}
 {conversation_context}
 
 ## User's Current Question
 {user_message}
-
-Please provide a helpful, detailed response to the user's question. You can reference:
-- Specific parts of the logs (quote relevant lines)
-- The issues identified in the triage report
-- The suggested actions
-- Technical details about the errors or problems
-
-Be conversational but technically accurate. If the user asks about something not in the logs or report, acknowledge the limitation but provide useful context where possible.
 """
-        
-        # Generate response
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config=GenerateContentConfig(
-                temperature=0.7  # Slightly more creative for conversational responses
-            )
-        )
-        
-        return response.text
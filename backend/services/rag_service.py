@@ -5,9 +5,13 @@ Currently mocks the ingestion process.
 import asyncio
 from models.schemas import RAGDocument
 
+# Cap the mock store per area; oldest documents are dropped first, which is
+# fine for a mock and keeps repeated uploads from growing memory unbounded
+_MAX_DOCUMENTS_PER_AREA = 500
+
 class RAGService:
     """Service for handling RAG document operations."""
-    
+
     def __init__(self):
         # In-memory storage for mock documents: {tech_area: [RAGDocument]}
         self._documents: dict[str, list[RAGDocument]] = {}
@@ -31,7 +35,9 @@ class RAGService:
             self._documents[tech_area] = []
         
         self._documents[tech_area].extend(documents)
-        
+        if len(self._documents[tech_area]) > _MAX_DOCUMENTS_PER_AREA:
+            self._documents[tech_area] = self._documents[tech_area][-_MAX_DOCUMENTS_PER_AREA:]
+
         # In a real implementation, this would:
         # 1. Split text into chunks
         # 2. Generate embeddings using an embedding model
@@ -4,32 +4,93 @@ Manages task storage, status tracking, and background processing.
 Can be easily replaced with Redis or database-backed storage.
 """
 import asyncio
+import hashlib
+import secrets
 import time
-import random
-import string
-from typing import Optional, Literal
-from threading import Lock
+from typing import NamedTuple, Optional
 
-from models.schemas import TriageResult, LogFile
+from cachetools import TTLCache
+
+from models.schemas import TaskStatus, TriageResult, LogFile, LogType
 from .base import BaseAIService
 
+# Completed tasks are only kept around for follow-up chat; bound both the
+# count and the age so logs from long-forgotten tasks don't pin memory in
+# a long-running process.
+_MAX_TASKS = 10_000
+_TASK_TTL_SECONDS = 24 * 3600
+
+
+class LogStore:
+    """
+    Bounded content-addressed store for raw log text.
+
+    Logs are keyed by their sha256 digest, so the same multi-megabyte log
+    uploaded across several tasks (retries, resubmissions) is stored once;
+    tasks hold only the digests. Entries expire on the same schedule as
+    the tasks that reference them.
+    """
+
+    def __init__(self, maxsize: int = _MAX_TASKS, ttl: float = _TASK_TTL_SECONDS):
+        self._store: TTLCache[str, str] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def put(self, content: str) -> str:
+        """Store log content and return its sha256 hex digest."""
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        self._store[digest] = content
+        return digest
+
+    def get(self, digest: str) -> Optional[str]:
+        """Return the content for a digest, or None if it has expired."""
+        return self._store.get(digest)
+
+
+class LogRef(NamedTuple):
+    """A task's handle on a stored log: content digest plus log type."""
+    content_hash: str
+    type: LogType
+
 
 class Task:
     """Represents a triage task."""
-    
+
     def __init__(
         self,
         task_id: str,
-        logs: list[LogFile],
-        user_answers: dict[str, str]
+        log_refs: list[LogRef],
+        user_answers: dict[str, str],
+        log_store: LogStore
     ):
         self.task_id = task_id
-        self.logs = logs
+        self.log_refs = log_refs
+        self._log_store = log_store
         self.user_answers = user_answers
-        self.status: Literal["PENDING", "PROCESSING", "SUCCESS", "FAILED"] = "PENDING"
+        self.status: TaskStatus = TaskStatus.PENDING
         self.result: Optional[TriageResult] = None
         self.message: str = "Task submitted"
         self.chat_history: list[dict[str, str]] = []  # Store chat conversation history
+        self.updated = asyncio.Event()  # Signals status changes to SSE subscribers
+
+    @property
+    def logs(self) -> list[LogFile]:
+        """
+        Rehydrate the task's log files from the content store.
+
+        Returns:
+            The log files in their original order
+
+        Raises:
+            LookupError: If any referenced log content has expired
+        """
+        logs = []
+        for ref in self.log_refs:
+            content = self._log_store.get(ref.content_hash)
+            if content is None:
+                raise LookupError(
+                    "Log content for this task has expired; please resubmit the logs."
+                )
+            logs.append(LogFile(content=content, type=ref.type))
+        return logs
 
 
 class TaskManager:
@@ -48,10 +109,17 @@ class TaskManager:
             ai_service: The AI service to use for processing tasks
         """
         self.ai_service = ai_service
-        self.tasks: dict[str, Task] = {}
-        self.lock = Lock()
+        # TTLCache evicts the oldest/expired entries on insert, so the task
+        # table can't grow without bound; note we keep task.logs alive while
+        # the entry lives because chat_about_report re-reads them
+        self.tasks: TTLCache[str, Task] = TTLCache(maxsize=_MAX_TASKS, ttl=_TASK_TTL_SECONDS)
+        # Raw log text lives here, content-addressed; tasks keep only digests
+        self.log_store = LogStore()
+        # asyncio.Lock: contention suspends the coroutine instead of
+        # blocking the event-loop thread the way threading.Lock did
+        self.lock = asyncio.Lock()
     
-    def create_task(
+    async def create_task(
         self,
         logs: list[LogFile],
         user_answers: dict[str, str]
@@ -68,19 +136,24 @@ class TaskManager:
         """
         # Generate unique task ID
         timestamp = str(int(time.time() * 1000))
-        random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=9))
-        task_id = f"task_{timestamp}_{random_suffix}"
+        task_id = f"task_{timestamp}_{secrets.token_hex(5)}"
         
+        # Deduplicate log content into the store; the task holds digests
+        log_refs = [
+            LogRef(content_hash=self.log_store.put(log.content), type=log.type)
+            for log in logs
+        ]
+
         # Create and store task
-        task = Task(task_id, logs, user_answers)
+        task = Task(task_id, log_refs, user_answers, self.log_store)
         
-        with self.lock:
+        async with self.lock:
             self.tasks[task_id] = task
         
         return task_id
     
-    def get_task_status(self, task_id: str) -> tuple[
-        Literal["PENDING", "PROCESSING", "SUCCESS", "FAILED"],
+    async def get_task_status(self, task_id: str) -> tuple[
+        TaskStatus,
         str,
         Optional[TriageResult]
     ]:
@@ -93,15 +166,15 @@ class TaskManager:
         Returns:
             Tuple of (status, message, result)
         """
-        with self.lock:
+        async with self.lock:
             task = self.tasks.get(task_id)
         
         if not task:
-            return ("FAILED", "Task not found.", None)
+            return (TaskStatus.FAILED, "Task not found.", None)
         
         return (task.status, task.message, task.result)
     
-    def cancel_task(self, task_id: str) -> bool:
+    async def cancel_task(self, task_id: str) -> bool:
         """
         Cancel a task if it's pending or processing.
         
@@ -111,11 +184,12 @@ class TaskManager:
         Returns:
             True if task was cancelled, False otherwise
         """
-        with self.lock:
+        async with self.lock:
             task = self.tasks.get(task_id)
-            if task and task.status in ["PENDING", "PROCESSING"]:
-                task.status = "FAILED"
+            if task and task.status in (TaskStatus.PENDING, TaskStatus.PROCESSING):
+                task.status = TaskStatus.FAILED
                 task.message = "Task cancelled by user."
+                task.updated.set()
                 return True
         
         return False
@@ -128,14 +202,15 @@ class TaskManager:
         Args:
             task_id: The task ID
         """
-        with self.lock:
+        async with self.lock:
             task = self.tasks.get(task_id)
-            if not task or task.status != "PENDING":
+            if not task or task.status != TaskStatus.PENDING:
                 return
             
             # Mark as processing
-            task.status = "PROCESSING"
+            task.status = TaskStatus.PROCESSING
             task.message = "AI is reviewing the logs..."
+            task.updated.set()
         
         try:
             # Call AI service to perform triage
@@ -145,22 +220,121 @@ class TaskManager:
             )
             
             # Update task with result
-            with self.lock:
+            async with self.lock:
                 # Check if task was cancelled while we were processing
-                if task.status == "PROCESSING":
-                    task.status = "SUCCESS"
+                if task.status == TaskStatus.PROCESSING:
+                    task.status = TaskStatus.SUCCESS
                     task.message = "Complete"
                     task.result = result
+                    task.updated.set()
         
         except Exception as e:
             # Handle errors
             print(f"Error processing task {task_id}: {e}")
-            with self.lock:
-                if task.status == "PROCESSING":
-                    task.status = "FAILED"
+            async with self.lock:
+                if task.status == TaskStatus.PROCESSING:
+                    task.status = TaskStatus.FAILED
                     task.message = f"Analysis failed: {str(e)}"
+                    task.updated.set()
     
-    def get_task_for_chat(self, task_id: str) -> Optional[Task]:
+    async def drain_pending_tasks(self) -> int:
+        """
+        Submit every PENDING task as one provider-side batch.
+
+        N tasks queued between drains become a single batch submission
+        instead of N interactive API calls, trading latency for the Batch
+        tier's discount and higher sustained throughput. Tasks cancelled
+        while the batch is in flight keep their cancelled state.
+
+        Returns:
+            Number of tasks submitted in this drain
+        """
+        async with self.lock:
+            pending = [
+                task for task in self.tasks.values()
+                if task.status == TaskStatus.PENDING
+            ]
+            for task in pending:
+                task.status = TaskStatus.PROCESSING
+                task.message = "Queued for batch analysis..."
+                task.updated.set()
+
+        if not pending:
+            return 0
+
+        try:
+            results = await self.ai_service.perform_triage_batch(
+                [(task.logs, task.user_answers) for task in pending]
+            )
+        except Exception as e:
+            print(f"Error draining pending tasks: {e}")
+            async with self.lock:
+                for task in pending:
+                    if task.status == TaskStatus.PROCESSING:
+                        task.status = TaskStatus.FAILED
+                        task.message = f"Analysis failed: {str(e)}"
+                        task.updated.set()
+            return len(pending)
+
+        async with self.lock:
+            for task, result in zip(pending, results):
+                # Skip tasks cancelled while the batch was in flight
+                if task.status != TaskStatus.PROCESSING:
+                    continue
+                if isinstance(result, Exception):
+                    task.status = TaskStatus.FAILED
+                    task.message = f"Analysis failed: {str(result)}"
+                else:
+                    task.status = TaskStatus.SUCCESS
+                    task.message = "Complete"
+                    task.result = result
+                task.updated.set()
+
+        return len(pending)
+
+    async def run_drain_loop(self, interval: float = 30.0) -> None:
+        """
+        Periodically drain pending tasks into batch submissions.
+
+        Meant to run as a long-lived asyncio task started from the app
+        lifespan when BATCH_DRAIN_TRIAGE is enabled.
+
+        Args:
+            interval: Seconds to sleep between drains
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.drain_pending_tasks()
+            except Exception as e:
+                # Keep the loop alive; individual drains already report
+                # failures onto their tasks
+                print(f"Error in batch drain loop: {e}")
+
+    async def wait_for_update(self, task_id: str, timeout: float = 15.0) -> None:
+        """
+        Wait until the task's status changes or the timeout elapses.
+
+        Used by the SSE status stream so state transitions are pushed
+        immediately while still emitting periodic heartbeats.
+
+        Args:
+            task_id: The task ID
+            timeout: Maximum seconds to wait before returning anyway
+        """
+        async with self.lock:
+            task = self.tasks.get(task_id)
+
+        if not task:
+            return
+
+        try:
+            await asyncio.wait_for(task.updated.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        task.updated.clear()
+
+    async def get_task_for_chat(self, task_id: str) -> Optional[Task]:
         """
         Get a task for chat interactions.
         
@@ -170,14 +344,14 @@ class TaskManager:
         Returns:
             Task object if found and successful, None otherwise
         """
-        with self.lock:
+        async with self.lock:
             task = self.tasks.get(task_id)
-            if task and task.status == "SUCCESS":
+            if task and task.status == TaskStatus.SUCCESS:
                 return task
         
         return None
     
-    def add_chat_message(self, task_id: str, role: str, content: str) -> bool:
+    async def add_chat_message(self, task_id: str, role: str, content: str) -> bool:
         """
         Add a chat message to the task's history.
         
@@ -189,9 +363,9 @@ class TaskManager:
         Returns:
             True if message was added, False otherwise
         """
-        with self.lock:
+        async with self.lock:
             task = self.tasks.get(task_id)
-            if task and task.status == "SUCCESS":
+            if task and task.status == TaskStatus.SUCCESS:
                 task.chat_history.append({"role": role, "content": content})
                 return True
         